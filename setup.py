@@ -31,10 +31,10 @@ setup(
     include_package_data=True,
     scripts=['workbench/server/workbench_server', 'workbench_apps/workbench_cli/workbench'],
     tests_require=['tox'],
-    install_requires=['cython', 'distorm3', 'elasticsearch', 'funcsigs', 'flask', 'filemagic', 
+    install_requires=['cython', 'distorm3', 'elasticsearch', 'funcsigs', 'flask', 'filemagic', 'gevent',
                       'ipython', 'lz4', 'mock', 'numpy', 'pandas', 'pefile',
                       'py2neo==1.6.4', 'pymongo', 'pytest', 'rekall==1.0.3', 'requests',
-                      'ssdeep==2.9-0.3', 'urllib3', 'yara', 'zerorpc', 'cython'],
+                      'ssdeep==2.9-0.3', 'urllib3', 'yara', 'zerorpc'],
     license='MIT',
     zip_safe=False,
     keywords='workbench security python',
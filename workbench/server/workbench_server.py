@@ -12,6 +12,7 @@ import zerorpc
 import zmq
 import logging
 logging.basicConfig()
+log = logging.getLogger(__name__)
 import json
 import hashlib
 import inspect
@@ -65,9 +66,6 @@ class WorkBench(object):
             neo_uri: The address where Neo4j is running.
         """
 
-        # Needs to be replaced by logger
-        self.VERBOSE = False
-
         # Workbench Server Version
         self.version = version.__version__
         print '<<< Workbench Server Version %s >>>' % self.version
@@ -811,19 +809,16 @@ class WorkBench(object):
             work_chain_mod_time = self._work_chain_mod_time(worker_name)
             if work_chain_mod_time < work_results[collection]['__time_stamp']:
                 return work_results
-            elif self.VERBOSE:
-                print 'VERBOSE: %s work_chain is newer than data' % (worker_name)
+            log.debug('%s work_chain is newer than data', worker_name)
         except WorkBench.DataNotFound:
-            if self.VERBOSE:
-                print 'Verbose: %s data not found generating' % (worker_name)
+            log.debug('%s data not found generating', worker_name)
 
         # Okay either need to generate (or re-generate) the work results
         dependencies = self.plugin_meta[worker_name]['dependencies']
         dependant_results = {}
         for dependency in dependencies:
             dependant_results.update(self._recursive_work_resolver(dependency, md5))
-        if self.VERBOSE:
-            print 'Verbose: new work for plugin: %s' % (worker_name)
+        log.debug('new work for plugin: %s', worker_name)
         work_results = self.plugin_meta[worker_name]['class']().execute(dependant_results)
 
         # Enforce dictionary output
@@ -4,6 +4,17 @@
 import re
 from IPython.core.prefilter import PrefilterTransformer
 
+# Built once at import, transform() is called on every input line
+_SKIP_CHARSET = frozenset(';,\'"()')
+_SPLIT_RE = re.compile(r"[ ;,'\"]")
+
+def _quote_tokens(line, tokens):
+    """Quote every whole (space delimited) occurrence of tokens in a single pass"""
+    if not tokens:
+        return line
+    pattern = re.compile(r'(?<!\S)(' + '|'.join(map(re.escape, tokens)) + r')(?!\S)')
+    return pattern.sub(r'"\1"', line)
+
 # Helper Classes
 class AutoQuoteTransformer(PrefilterTransformer):
     """ AutoQuoteTransformer: IPython Transformer so we can shortcut
@@ -16,18 +27,26 @@ class AutoQuoteTransformer(PrefilterTransformer):
     def transform(self, line, _continue_prompt):
         """Shortcut Workbench commands by using 'auto-quotes'"""
 
+        # Fast path: blank lines, comments, magics/shell escapes, indented
+        # lines and single tokens never get quoted
+        if not line or line[0] in ' #!%' or ' ' not in line:
+            return line
+
         # Capture the original line
         orig_line = line
 
         # Get tokens from all the currently active namespace
-        ns_token_set = set([token for nspace in self.shell.all_ns_refs for token in nspace])
+        ns_token_set = {token for nspace in self.shell.all_ns_refs for token in nspace}
 
-        # Build up token set and info out of the incoming line
-        token_list = re.split(' |;|,|(|)|\'|"', line)
-        token_list = [item for item in token_list if item != None and item != '']
+        # Build up the token list (in order, no duplicates) out of the incoming line
+        token_list = []
+        seen = set()
+        for token in _SPLIT_RE.split(line):
+            if token and token not in seen:
+                seen.add(token)
+                token_list.append(token)
         num_tokens = len(token_list)
         first_token = token_list[0]
-        token_set = set(token_list)       
 
         # Very conservative logic (but possibly flawed)
         # 1) Lines with any of these symbols ; , ' " ( ) aren't touched
@@ -54,8 +73,7 @@ class AutoQuoteTransformer(PrefilterTransformer):
             return line
 
         # 1) Lines with any of these symbols ; , ' " ( ) aren't touched
-        skip_symbols = [';', ',', '\'', '"', '(', ')']
-        if any([sym in line for sym in skip_symbols]):
+        if not _SKIP_CHARSET.isdisjoint(line):
             return line
 
         # 2) Need to have more than one token
@@ -64,15 +82,31 @@ class AutoQuoteTransformer(PrefilterTransformer):
 
             # 4) If first token is 'help' than all other tokens are quoted
             if first_token == 'help':
-                token_set.remove('help')
-                for token in token_set:
-                    line = line.replace(token, '"'+token+'"')
+                line = _quote_tokens(line, [token for token in token_list if token != 'help'])
 
             # 5) Otherwise only tokens that are not in any of the namespace are quoted
             else: # Not help
-                for token in token_set:
-                    if token not in ns_token_set:
-                        line = line.replace(token, '"'+token+'"')
+                line = _quote_tokens(line, [token for token in token_list
+                                            if token not in ns_token_set and token != first_token])
 
         # Return the processed line
         return line
+
+def test():
+    """Test the AutoQuoteTransformer"""
+    from IPython.core.interactiveshell import InteractiveShell
+    shell = InteractiveShell.instance()
+    shell.push({'view': None, 'md5': None, 'load_sample': None, 'pivot': None})
+    auto_quoter = AutoQuoteTransformer(shell, shell.prefilter_manager)
+    auto_quoter.register_command_set(set(['view', 'help', 'load_sample', 'pivot']))
+
+    # Explicit calls are left alone
+    for line in ["load_sample('/tmp/x', ['bad'])", "pivot(md5, 'mytag')", "pivot('abc123', 'tag')"]:
+        assert auto_quoter.transform(line, False) == line
+
+    # Shortcut commands get their arguments quoted
+    assert auto_quoter.transform('view ab abc', False) == 'view "ab" "abc"'
+    assert auto_quoter.transform('help foo', False) == 'help "foo"'
+
+if __name__ == '__main__':
+    test()
@@ -1,6 +1,7 @@
 """File Streaming for Workbench CLI"""
 
 import os, sys
+import hashlib
 import lz4
 
 class FileStreamer(object):
@@ -21,17 +22,30 @@ class FileStreamer(object):
         # Some defaults and counters
         self.chunk_size = 1024*1024 # 1 MB
 
-    def _file_chunks(self, data, chunk_size):
-        """ Yield compressed chunks from a data array"""
-        for i in xrange(0, len(data), chunk_size):
-            yield self.compressor(data[i:i+chunk_size])
-
-    def stream_to_workbench(self, raw_bytes, filename, type_tag, tags):
+    def _file_chunks(self, file_handle, chunk_size):
+        """ Yield compressed chunks read from a file handle"""
+        for chunk in iter(lambda: file_handle.read(chunk_size), b''):
+            yield self.compressor(chunk)
+
+    def file_md5(self, file_handle):
+        """Compute the md5 of a file a chunk at a time (never holds the whole file)"""
+
+        # Read into one reusable buffer (no new string per chunk)
+        md5 = hashlib.md5()
+        buf = bytearray(self.chunk_size)
+        view = memoryview(buf)
+        size = file_handle.readinto(buf)
+        while size:
+            md5.update(view[:size])
+            size = file_handle.readinto(buf)
+        return md5.hexdigest()
+
+    def stream_to_workbench(self, file_handle, filename, type_tag, tags):
         """Split up a large file into chunks and send to Workbench"""
         md5_list = []
         sent_bytes = 0
-        total_bytes = len(raw_bytes)
-        for chunk in self._file_chunks(raw_bytes, self.chunk_size):
+        total_bytes = os.fstat(file_handle.fileno()).st_size
+        for chunk in self._file_chunks(file_handle, self.chunk_size):
             md5_list.append(self.workbench.store_sample(chunk, filename, self.compress_ident))
             sent_bytes += self.chunk_size
             self.progress(sent_bytes, total_bytes)
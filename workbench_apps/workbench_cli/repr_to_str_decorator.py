@@ -3,16 +3,16 @@
 
 import functools
 
+class ReprToStr(str):
+    """Replaces a class __repr__ with it's string representation"""
+    def __repr__(self):
+        return str(self)
+
 def r_to_s(func):
     """Decorator method for Workbench methods returning a str"""
 
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
         """Decorator method for Workbench methods returning a str"""
-
-        class ReprToStr(str):
-            """Replaces a class __repr__ with it's string representation"""
-            def __repr__(self):
-                return str(self)
         return ReprToStr(func(*args, **kwargs))
     return wrapper
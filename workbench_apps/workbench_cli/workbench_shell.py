@@ -1,14 +1,19 @@
 """Workbench Interactive Shell using IPython"""
 
 import os, sys
-import hashlib
+import gevent.pool
 import zerorpc
 import IPython
 import lz4
 import inspect
+from functools import partial
 import funcsigs
 import operator
 import pprint
+try:
+    from scandir import walk # Faster directory walks on Python 2 (os.walk uses scandir on 3.5+)
+except ImportError:
+    from os import walk
 from IPython.utils.coloransi import TermColors as color
 #pylint: disable=no-member
 
@@ -18,12 +23,6 @@ except ImportError:
     print '\n%sNotice: pandas not found...' % color.Yellow
     print '\t%sWe recommend installing pandas: %s$ pip install pandas%s' % (color.LightBlue, color.Red, color.Normal)
 
-try:
-    import matplotlib.pyplot as plt
-    plt.ion()
-except ImportError:
-    print '\n%sNotice: matplotlib not found...' % color.Yellow
-    print '\t%sWe recommend installing matplotlib: %s$ pip install matplotlib%s' % (color.LightBlue, color.Red, color.Normal)
 try:
     from . import client_helper
     from . import help_content
@@ -46,6 +45,9 @@ except (ImportError,ValueError):
 class WorkbenchShell(object):
     """Workbench CLI using IPython Interactive Shell"""
 
+    # Max number of has_sample probes in flight when loading a directory
+    _has_sample_concurrency = 8
+
     def __init__(self):
         ''' Workbench CLI Initialization '''
 
@@ -72,6 +74,12 @@ class WorkbenchShell(object):
         # Our Interactive IPython shell
         self.ipshell = None
 
+        # Progress bar rows (one per percent) and the last percent drawn
+        self._progress_bars = ['{0}[{1}{2}] {3}{4}%{5}'.format(color.Green, '#'*(percent/2), ' '*(50-percent/2),
+                                                               color.Yellow, percent, color.Normal)
+                               for percent in xrange(101)]
+        self._last_percent = None
+
         # Our File Streamer
         self.streamer = file_streamer.FileStreamer(self.workbench, self._progress_print)
 
@@ -104,25 +112,35 @@ class WorkbenchShell(object):
         if os.path.isdir(file_path):
             file_list = self._all_files_in_directory(file_path)
         else:
-            file_list = [file_path]
+            file_list = [(file_path, os.path.basename(file_path))]
+
+        # Compute the md5s of all the files
+        path_md5s = []
+        for path, basename in file_list:
+            with open(path, 'rb') as my_file:
+                path_md5s.append((path, basename, self.streamer.file_md5(my_file)))
+
+        # Ask workbench which samples it already has, ZeroRPC is gevent based so a
+        # small pool of probes pipelines them over the one connection
+        probe_pool = gevent.pool.Pool(self._has_sample_concurrency)
+        have_list = probe_pool.map(self.workbench.has_sample, [md5 for _, _, md5 in path_md5s])
 
         # Upload the files into workbench
         md5_list = []
-        for path in file_list:
-            with open(path, 'rb') as my_file:
-                raw_bytes = my_file.read()
-                md5 = hashlib.md5(raw_bytes).hexdigest()
-                if not self.workbench.has_sample(md5):
-                    print '%sStreaming Sample...%s' % (color.LightPurple, color.Normal)
-                    basename = os.path.basename(path)
-                    md5 = self.streamer.stream_to_workbench(raw_bytes, basename, 'unknown', tags)
+        streamed = set()
+        for (path, basename, md5), have_sample in zip(path_md5s, have_list):
+            if not have_sample and md5 not in streamed: # Duplicate files only get streamed once
+                print '%sStreaming Sample...%s' % (color.LightPurple, color.Normal)
+                with open(path, 'rb') as my_file:
+                    md5 = self.streamer.stream_to_workbench(my_file, basename, 'unknown', tags)
+                streamed.add(md5)
 
-                print '\n%s  %s%s %sLocked and Loaded...%s\n' % \
-                      (self.beer, color.LightPurple, md5[:6], color.Yellow, color.Normal)
+            print '\n%s  %s%s %sLocked and Loaded...%s\n' % \
+                  (self.beer, color.LightPurple, md5[:6], color.Yellow, color.Normal)
 
-                # Add tags to the sample
-                self.workbench.add_tags(md5, tags)
-                md5_list.append(md5)
+            # Add tags to the sample
+            self.workbench.add_tags(md5, tags)
+            md5_list.append(md5)
 
         # Pivot on the sample_set
         set_md5 = self.workbench.store_sample_set(md5_list)
@@ -154,16 +172,14 @@ class WorkbenchShell(object):
             if len(ss) == 1:
                 md5 = ss[0]
             deco = '(%s:%d)' % (tag, len(ss))
-            self.ipshell.push({'prompt_deco': deco})
         else:
             deco = '(%s:1)' % tag
-            self.ipshell.push({'prompt_deco': deco})
 
-        # Set the new md5
+        # Set the new md5 (one push so the shell namespace is only updated once)
         self.session.md5 = md5
         self.session.short_md5 = md5[:6]
-        self.ipshell.push({'md5': self.session.md5})
-        self.ipshell.push({'short_md5': self.session.short_md5})        
+        self.session.prompt_deco = deco
+        self.ipshell.push({'prompt_deco': deco, 'md5': self.session.md5, 'short_md5': self.session.short_md5})
         
     def tags(self):
         '''Display tag information for all samples in database'''
@@ -187,7 +203,7 @@ class WorkbenchShell(object):
             _df = pd.read_msgpack(lz4.loads(_packed_df))
             return _df
         except zerorpc.exceptions.RemoteError as e:
-            return repr_to_str_decorator.r_to_s(self._data_not_found)(e)
+            return self._data_not_found(e)
 
     def vectorize(self, df, column_name):
         """Vectorize a column in the dataframe"""
@@ -244,6 +260,15 @@ class WorkbenchShell(object):
         self.tags()
         print '\n%s' % self.workbench.help('cli')
 
+        # Matplotlib is only needed for the interactive shell (so don't import it until now)
+        try:
+            import matplotlib.pyplot as plt
+            plt.ion()
+            self.command_dict['plt'] = plt
+        except ImportError:
+            print '\n%sNotice: matplotlib not found...' % color.Yellow
+            print '\t%sWe recommend installing matplotlib: %s$ pip install matplotlib%s' % (color.LightBlue, color.Red, color.Normal)
+
         # Now that we have the Workbench connection spun up, we register some stuff
         # with the embedded IPython interpreter and than spin it up
         cfg = IPython.config.loader.Config()
@@ -274,32 +299,53 @@ class WorkbenchShell(object):
     def _connect(self, server_info):
         """Connect to the workbench server"""
 
-        # First we do a temp connect with a short heartbeat
-        _tmp_connect = zerorpc.Client(timeout=300, heartbeat=2)
-        _tmp_connect.connect('tcp://'+server_info['server']+':'+server_info['port'])
+        # Replace any existing connection
+        server_uri = 'tcp://'+server_info['server']+':'+server_info['port']
+        if self.workbench:
+            self.workbench.close()
+        self.workbench = zerorpc.Client(timeout=300, heartbeat=60)
+        self.workbench.connect(server_uri)
+
+        # Probe the server on the same connection (short timeout so a dead server fails fast)
         try:
-            _tmp_connect._zerorpc_name()
-            _tmp_connect.close()
-            del _tmp_connect
-        except zerorpc.exceptions.LostRemote:
+            self.workbench._zerorpc_name(timeout=5)
+        except (zerorpc.exceptions.LostRemote, zerorpc.exceptions.TimeoutExpired):
             print '%sError: Could not connect to Workbench Server at %s:%s%s' % \
                   (color.Red, server_info['server'], server_info['port'], color.Normal)
-            sys.exit(1)
-
-        # Okay do the real connection
-        if self.workbench:
             self.workbench.close()
-        self.workbench = zerorpc.Client(timeout=300, heartbeat=60)
-        self.workbench.connect('tcp://'+server_info['server']+':'+server_info['port'])
+            sys.exit(1)
         print '\n%s<<< Connected: %s:%s >>>%s' % (color.Green, server_info['server'], server_info['port'], color.Normal)
 
+    def _reconnect(self, server_info=None):
+        """Reconnect to the workbench server (optionally a different one) and
+           rebind everything holding the old client"""
+
+        if server_info:
+            self.server_info = server_info
+        self._connect(self.server_info)
+        self.streamer.workbench = self.workbench
+        self.help_deco = repr_to_str_decorator.r_to_s(self.workbench.help)
+
+        # Regenerate the commands (the server may have new workers) and update the shell
+        self.command_dict = self._generate_command_dict()
+        self.command_set.clear()
+        self.command_set.update(self.command_dict.keys())
+        if self.ipshell:
+            self.ipshell.push(self.command_dict)
+
     def _progress_print(self, sent, total):
         """Progress print show the progress of the current upload with a neat progress bar
            Credits: http://redino.net/blog/2013/07/display-a-progress-bar-in-console-using-python/
         """
-        percent = min(int(sent*100.0/total), 100)
-        sys.stdout.write('\r{0}[{1}{2}] {3}{4}%{5}'.
-                         format(color.Green, '#'*(percent/2), ' '*(50-percent/2), color.Yellow, percent, color.Normal))
+        percent = sent*100//total
+        if percent > 100:
+            percent = 100
+
+        # Only redraw when the percent changes (reset on a full bar so the next upload draws)
+        if percent == self._last_percent:
+            return
+        self._last_percent = None if percent == 100 else percent
+        sys.stdout.write('\r' + self._progress_bars[percent])
         sys.stdout.flush()
 
     def _work_request(self, worker, md5=None):
@@ -311,16 +357,17 @@ class WorkbenchShell(object):
         elif not md5:
             md5 = self.session.md5
 
-        # Is the md5 a sample_set?
-        if self.workbench.is_sample_set(md5):
-            return self.workbench.set_work_request(worker, md5)
-
-        # Make the work_request with worker and md5 args
         try:
+            # Is the md5 a sample_set?
+            if self.workbench.is_sample_set(md5):
+                return self.workbench.set_work_request(worker, md5)
+
+            # Make the work_request with worker and md5 args
             return self.workbench.work_request(worker, md5)
         except zerorpc.exceptions.RemoteError as e:
-            return repr_to_str_decorator.r_to_s(self._data_not_found)(e)
+            return self._data_not_found(e)
 
+    @repr_to_str_decorator.r_to_s
     def _data_not_found(self, e):
         """Message when you get a DataNotFound exception from the server"""
         return '%s%s%s' % (color.Red, e.msg, color.Normal)
@@ -333,7 +380,7 @@ class WorkbenchShell(object):
         # First add all the workers
         commands = {}
         for worker in self.workbench.list_all_workers():
-            commands[worker] = lambda md5=None, worker=worker: self._work_request(worker, md5)
+            commands[worker] = partial(self._work_request, worker)
 
         # Next add all the commands
         for command in self.workbench.list_all_commands():
@@ -353,7 +400,7 @@ class WorkbenchShell(object):
             'tags': self.tags,
             'pivot': self.pivot,
             'search': self.search,
-            'reconnect': lambda info=self.server_info: self._connect(info),
+            'reconnect': self._reconnect,
             'version': self.versions,
             'versions': self.versions,
             'short_md5': self.session.short_md5,
@@ -366,12 +413,12 @@ class WorkbenchShell(object):
 
     @staticmethod
     def _all_files_in_directory(path):
-        """ Recursively ist all files under a directory """
+        """ Recursively list all files under a directory as (path, filename) pairs """
         file_list = []
-        for dirname, dirnames, filenames in os.walk(path):
+        for dirname, dirnames, filenames in walk(path):
             for filename in filenames:
                 if filename != '.DS_Store':
-                    file_list.append(os.path.join(dirname, filename))
+                    file_list.append((os.path.join(dirname, filename), filename))
         return file_list
 
     # Internal Class